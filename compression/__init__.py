@@ -1,4 +1,17 @@
-from .compress import compress, compress_to_file, serialise
-from .decompress import decompress, decompress_from_file, deserialise
+from .compress import (
+    append_frame_to_file,
+    compress,
+    compress_to_file,
+    serialise,
+    serialise_to_file,
+    stream_compress_to_file,
+)
+from .decompress import (
+    count_frames,
+    decompress,
+    decompress_frame_from_file,
+    decompress_from_file,
+    deserialise,
+)
 from .exceptions import InconsistentShape, UnexpectedLeaf
 from .types import CompressedList, IntListND, DataEntry
@@ -1,3 +1,4 @@
 from .compress import compress
-from .serialise import serialise
-from .to_file import compress_to_file
+from .frames_to_file import append_frame_to_file
+from .serialise import serialise, serialise_to_file
+from .to_file import compress_to_file, stream_compress_to_file
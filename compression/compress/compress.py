@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 from ..exceptions import InconsistentShape, UnexpectedLeaf
 from ..types import CompressedList, DataEntry, IntListND
@@ -116,32 +116,49 @@ def consume_data_entry(
     return DataEntry(value, path, lengths)
 
 
-def compress(data: IntListND) -> CompressedList:
-    """Compresses data into a flattened tuple of DataEntry objects
+def generate_entries(data: IntListND, shape: Tuple[int]) -> Iterator[DataEntry]:
+    """Consumes data, yielding each DataEntry as soon as its cuboid is found
 
     Args:
-        data (IntListND): Any dimensional List of integers. It must have a consistent shape.
+        data (IntListND): Validated copy of the data, which gets consumed
+        shape (Tuple[int]): Shape of the data
 
-    Returns:
-        CompressedList: Compressed version of the data
+    Yields:
+        DataEntry: Next cuboid of the data, including ones with the default value
     """
-    data_copy, shape = validate_and_copy(data)
-
-    entries = []
     index = 0
     max_index = reduce(lambda a, b: a * b, shape)
     while index < max_index:
         path = make_path(shape, index)
-        if value_at(data_copy, path) == None:
+        if value_at(data, path) == None:
             index += 1
         else:
-            data_entry = consume_data_entry(data_copy, shape, path)
-            entries.append(data_entry)
+            data_entry = consume_data_entry(data, shape, path)
+            yield data_entry
             index += data_entry.lengths[-1]
 
+
+def count_values(entries: Iterable[DataEntry]) -> Dict[int, int]:
     value_counts = {}
     for entry in entries:
         value_counts[entry.value] = value_counts.get(entry.value, 0) + 1
+    return value_counts
+
+
+def compress(data: IntListND) -> CompressedList:
+    """Compresses data into a flattened tuple of DataEntry objects
+
+    Args:
+        data (IntListND): Any dimensional List of integers. It must have a consistent shape.
+
+    Returns:
+        CompressedList: Compressed version of the data
+    """
+    data_copy, shape = validate_and_copy(data)
+
+    entries = list(generate_entries(data_copy, shape))
+
+    value_counts = count_values(entries)
     default_value = max(value_counts.items(), key=lambda item: item[1])[0]
     filtered_entries = list(filter(lambda entry: entry.value != default_value, entries))
 
@@ -0,0 +1,138 @@
+import os
+from typing import Dict
+
+from ..constants import (
+    DEFAULT_KEYFRAME_INTERVAL,
+    DELTA_FRAME,
+    FRAME_INDEX_HEADER_INTS,
+    FRAME_INDEX_INT_BYTES,
+    FRAME_INDEX_SUFFIX,
+    KEYFRAME,
+    VERSION,
+)
+from ..decompress.deserialise import deserialise
+from ..decompress.frames_from_file import (
+    count_frames_in_index,
+    read_frame_record,
+    read_frame_start,
+    read_keyframe_interval,
+)
+from ..types import CompressedList, DataEntry, IntListND
+from .compress import compress
+from .serialise import serialise
+
+
+def entry_key(entry: DataEntry) -> DataEntry:
+    # Deserialised entries hold lists, so normalising to tuples to be able to compare them
+    return DataEntry(entry.value, tuple(entry.path), tuple(entry.lengths))
+
+
+def delta_from_keyframe(
+    keyframe: CompressedList, compressed_list: CompressedList
+) -> CompressedList | None:
+    if (
+        keyframe.shape != compressed_list.shape
+        or keyframe.default_value != compressed_list.default_value
+    ):
+        return None
+
+    keyframe_entries = set(entry_key(entry) for entry in keyframe.entries)
+    frame_entries = set(entry_key(entry) for entry in compressed_list.entries)
+    # Entries are disjoint cuboids, so resetting removed ones to the default value before painting
+    # the added ones gives back the frame
+    removed = [
+        DataEntry(compressed_list.default_value, entry.path, entry.lengths)
+        for entry in map(entry_key, keyframe.entries)
+        if entry not in frame_entries
+    ]
+    added = [
+        entry
+        for entry in compressed_list.entries
+        if entry_key(entry) not in keyframe_entries
+    ]
+    if len(removed) + len(added) >= len(compressed_list.entries):
+        return None
+
+    return CompressedList(
+        compressed_list.shape, compressed_list.default_value, removed + added
+    )
+
+
+def append_frame_to_file(
+    file_path: str,
+    data: IntListND,
+    metadata: Dict[str, str] = None,
+    keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+) -> int:
+    """Compresses data and appends it as a new frame to a multi-frame file, without rewriting existing frames
+
+    Args:
+        file_path (str): Multi-frame file to append to. Its frame index is kept at file_path + ".idx".
+        data (IntListND): N dimensional list of integers to compress. Must have a consistent shape.
+        metadata (Dict[str, str], optional): Any custom metadata to save alongside the frame. Defaults to None.
+        keyframe_interval (int, optional): Every how many frames a keyframe is stored. Only used when creating the file. Defaults to DEFAULT_KEYFRAME_INTERVAL.
+
+    Returns:
+        int: Index of the appended frame
+    """
+    if keyframe_interval < 1:
+        raise ValueError("Keyframe interval must be 1 or greater")
+
+    index_path = file_path + FRAME_INDEX_SUFFIX
+    if not os.path.exists(index_path):
+        # Refusing to overwrite a data file whose index is missing, since it may not be a multi-frame file at all.
+        # An empty one is left over from an interrupted creation, so there's nothing to lose
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            raise FileExistsError(
+                f"{file_path} already exists without a frame index at {index_path}"
+            )
+        open(file_path, "wb").close()
+        # Moving the index into place only once its header is written, so it's never found half written
+        with open(index_path + ".tmp", "wb") as index_handle:
+            index_handle.write(
+                VERSION.to_bytes(FRAME_INDEX_INT_BYTES, "big")
+                + keyframe_interval.to_bytes(FRAME_INDEX_INT_BYTES, "big")
+            )
+        os.replace(index_path + ".tmp", index_path)
+    elif not os.path.exists(file_path):
+        raise FileNotFoundError(
+            f"Found the frame index at {index_path} but the frame file {file_path} is missing"
+        )
+
+    compressed_list = compress(data)
+    with open(file_path, "rb") as file_handle, open(index_path, "rb") as index_handle:
+        keyframe_interval = read_keyframe_interval(index_handle)
+        frame_idx = count_frames_in_index(index_handle)
+
+        frame = compressed_list
+        frame_type = KEYFRAME
+        if frame_idx % keyframe_interval != 0:
+            _, serialised_keyframe = read_frame_record(
+                file_handle, index_handle, frame_idx - frame_idx % keyframe_interval
+            )
+            delta = delta_from_keyframe(
+                deserialise(serialised_keyframe)[0], compressed_list
+            )
+            # Falling back to a self contained frame when a delta wouldn't be any smaller
+            if delta is not None:
+                frame = delta
+                frame_type = DELTA_FRAME
+
+    # Writing the frame before its index entry, and dropping anything past the last indexed frame in
+    # both files first, so leftovers from an interrupted append never end up as part of this frame
+    with open(index_path, "r+b") as index_handle:
+        start = read_frame_start(index_handle, frame_idx)
+        with open(file_path, "r+b") as file_handle:
+            file_handle.seek(start)
+            file_handle.truncate()
+            file_handle.write(
+                (frame_type + serialise(frame, metadata)).encode("utf-8")
+            )
+            end = file_handle.tell()
+        index_handle.seek(
+            (FRAME_INDEX_HEADER_INTS + frame_idx) * FRAME_INDEX_INT_BYTES
+        )
+        index_handle.truncate()
+        index_handle.write(end.to_bytes(FRAME_INDEX_INT_BYTES, "big"))
+
+    return frame_idx
@@ -1,8 +1,8 @@
 from math import ceil, log2
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterable, List, Tuple
 
-from ..constants import RESERVED_KEYS, VERSION
-from ..types import CompressedList
+from ..constants import RESERVED_KEYS, STREAM_BLOCK_CHARS, VERSION
+from ..types import CompressedList, DataEntry
 
 
 def pos_int_to_bits(n: int, length: int) -> str:
@@ -45,47 +45,15 @@ def sanitize(s: str) -> str:
     return s.replace(chr(1), chr(1) + chr(1)).replace(chr(0), chr(1) + chr(0))
 
 
-def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None) -> str:
-    """Serialises a CompressedList to binary
-
-    Args:
-        compressed_list (CompressedList): Data to serialise
-        metadata (Dict[str, str]): Custom metadata to serialise alongside the data. Defaults to None.
-
-    Returns:
-        str: Serialised data
-    """
-    possible_values = sorted(set(entry.value for entry in compressed_list.entries))
-    value_lookup = {v: i for i, v in enumerate(possible_values)}
-    deltas = [n - p for n, p in zip(possible_values[1:], possible_values[:-1])]
-
-    max_path_sizes = []
-    if compressed_list.entries:
-        for i in range(len(compressed_list.shape)):
-            curr_max_path = max(
-                compressed_list.entries, key=lambda entry, i=i: entry.path[i]
-            ).path[i]
-            max_path_sizes.append(ceil(log2(curr_max_path + 1)))
-
-    # Lengths have to be 1 or greater, so subtracting 1 from each length
-    max_length_sizes = []
-    if compressed_list.entries:
-        for i in range(len(compressed_list.shape)):
-            curr_max_length = max(
-                compressed_list.entries, key=lambda entry, i=i: entry.lengths[i]
-            ).lengths[i]
-            if curr_max_length > 0:
-                max_length_sizes.append(ceil(log2(curr_max_length)))
-            else:
-                max_length_sizes.append(0)
-
-    value_bit_length = ceil(log2(len(possible_values) + 1))
-    data_bits = "".join(
-        (
-            pos_int_to_bits(value_lookup[entry.value], value_bit_length)
-            if len(possible_values) > 0
-            else ""
-        )
+def entry_to_bits(
+    entry: DataEntry,
+    value_lookup: Dict[int, int],
+    value_bit_length: int,
+    max_path_sizes: List[int],
+    max_length_sizes: List[int],
+) -> str:
+    return (
+        pos_int_to_bits(value_lookup[entry.value], value_bit_length)
         + "".join(
             pos_int_to_bits(n, max_path_sizes[i])
             for i, n in enumerate(entry.path)
@@ -96,16 +64,26 @@ def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None)
             for i, n in enumerate(entry.lengths)
             if max_length_sizes[i] > 0
         )
-        for entry in compressed_list.entries
     )
 
+
+def build_default_metadata(
+    shape: Tuple[int],
+    default_value: int,
+    possible_values: List[int],
+    max_path_sizes: List[int],
+    max_length_sizes: List[int],
+    data_offset: int | None = None,
+) -> Dict[str, str]:
+    deltas = [n - p for n, p in zip(possible_values[1:], possible_values[:-1])]
+
     # Convert numbers into dynamic int binary
     default_metadata = {
         "VN": pos_int_to_dynamic_bytes(VERSION),
-        "DP" if compressed_list.default_value >= 0 else "DN": pos_int_to_dynamic_bytes(
-            abs(compressed_list.default_value)
+        "DP" if default_value >= 0 else "DN": pos_int_to_dynamic_bytes(
+            abs(default_value)
         ),
-        "SD": pos_int_list_to_dynamic_bytes(compressed_list.shape),
+        "SD": pos_int_list_to_dynamic_bytes(shape),
     }
     if possible_values:
         run_length_offset_deltas = []
@@ -118,15 +96,23 @@ def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None)
                 run_length_offset_deltas.append([0, offset])
             else:
                 run_length_offset_deltas[-1][0] += 1
-        delta_run_bit_length = ceil(
-            log2(max(item[0] for item in run_length_offset_deltas) + 1)
+        # Run lengths always take at least 1 bit, so every delta item takes up space and can be counted back
+        delta_run_bit_length = max(
+            ceil(
+                log2(max((item[0] for item in run_length_offset_deltas), default=0) + 1)
+            ),
+            1,
         )
         delta_bit_length = ceil(
-            log2(max(item[1] for item in run_length_offset_deltas) + 1)
+            log2(max((item[1] for item in run_length_offset_deltas), default=0) + 1)
         )
         delta_bits = "".join(
-            (pos_int_to_bits(run, delta_run_bit_length) if run > 0 else "")
-            + (pos_int_to_bits(delta, delta_bit_length) if delta > 0 else "")
+            pos_int_to_bits(run, delta_run_bit_length)
+            + (
+                pos_int_to_bits(delta, delta_bit_length)
+                if delta_bit_length > 0
+                else ""
+            )
             for run, delta in run_length_offset_deltas
         )
 
@@ -137,11 +123,18 @@ def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None)
         default_metadata["DB"] = pos_int_to_dynamic_bytes(delta_bit_length)
         default_metadata["VD"] = bits_to_bytes(delta_bits)
         default_metadata["RO"] = f"{(8-len(delta_bits)) % 8}"
-        default_metadata["DO"] = f"{(8-len(data_bits)) % 8}"
+        if data_offset is not None:
+            default_metadata["DO"] = f"{data_offset}"
         default_metadata["AS"] = pos_int_list_to_dynamic_bytes(
             max_path_sizes + max_length_sizes
         )
 
+    return default_metadata
+
+
+def serialise_metadata(
+    metadata: Dict[str, str] | None, default_metadata: Dict[str, str]
+) -> str:
     output_parts = []
 
     if metadata is not None:
@@ -158,9 +151,122 @@ def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None)
             for key, value in default_metadata.items()
         )
     )
-    if possible_values:
-        output_parts.append("CD" + chr(0) + bits_to_bytes(data_bits))
 
-    output = chr(0).join(output_parts)
+    return chr(0).join(output_parts)
+
+
+def serialise(compressed_list: CompressedList, metadata: Dict[str, str] = None) -> str:
+    """Serialises a CompressedList to binary
+
+    Args:
+        compressed_list (CompressedList): Data to serialise
+        metadata (Dict[str, str]): Custom metadata to serialise alongside the data. Defaults to None.
+
+    Returns:
+        str: Serialised data
+    """
+    possible_values = sorted(set(entry.value for entry in compressed_list.entries))
+    value_lookup = {v: i for i, v in enumerate(possible_values)}
+
+    max_path_sizes = []
+    if compressed_list.entries:
+        for i in range(len(compressed_list.shape)):
+            curr_max_path = max(
+                compressed_list.entries, key=lambda entry, i=i: entry.path[i]
+            ).path[i]
+            max_path_sizes.append(ceil(log2(curr_max_path + 1)))
+
+    # Lengths have to be 1 or greater, so subtracting 1 from each length
+    max_length_sizes = []
+    if compressed_list.entries:
+        for i in range(len(compressed_list.shape)):
+            curr_max_length = max(
+                compressed_list.entries, key=lambda entry, i=i: entry.lengths[i]
+            ).lengths[i]
+            if curr_max_length > 0:
+                max_length_sizes.append(ceil(log2(curr_max_length)))
+            else:
+                max_length_sizes.append(0)
+
+    value_bit_length = ceil(log2(len(possible_values) + 1))
+    data_bits = "".join(
+        entry_to_bits(
+            entry, value_lookup, value_bit_length, max_path_sizes, max_length_sizes
+        )
+        for entry in compressed_list.entries
+    )
+
+    default_metadata = build_default_metadata(
+        compressed_list.shape,
+        compressed_list.default_value,
+        possible_values,
+        max_path_sizes,
+        max_length_sizes,
+        (8 - len(data_bits)) % 8,
+    )
+
+    output = serialise_metadata(metadata, default_metadata)
+    if possible_values:
+        output += chr(0) + "CD" + chr(0) + bits_to_bytes(data_bits)
 
     return output
+
+
+def serialise_to_file(
+    file_handle: BinaryIO,
+    shape: Tuple[int],
+    default_value: int,
+    possible_values: List[int],
+    entries: Iterable[DataEntry],
+    entry_count: int,
+    metadata: Dict[str, str] = None,
+) -> None:
+    """Serialises entries straight to a file object as they are produced, so only one block of compressed data is held at a time
+
+    Args:
+        file_handle (BinaryIO): Binary file object to write to, which doesn't need to be seekable
+        shape (Tuple[int]): Shape of the original data
+        default_value (int): Default value of the original data
+        possible_values (List[int]): Every value found in the entries. The caller must guarantee this, as an entry with any other value raises a KeyError part way through writing.
+        entries (Iterable[DataEntry]): Entries to serialise, which can be a generator
+        entry_count (int): Number of entries, needed up front to write DO before the compressed data
+        metadata (Dict[str, str], optional): Custom metadata to serialise alongside the data. Defaults to None.
+    """
+    possible_values = sorted(set(possible_values))
+    value_lookup = {v: i for i, v in enumerate(possible_values)}
+
+    # Sizing attributes from the shape, since paths and lengths (minus 1) can't go past shape[i] - 1
+    max_path_sizes = [ceil(log2(n)) if n > 1 else 0 for n in shape]
+    max_length_sizes = list(max_path_sizes)
+    value_bit_length = ceil(log2(len(possible_values) + 1))
+    # Every entry takes the same number of bits, so DO is known before any entry is written
+    entry_bit_length = value_bit_length + sum(max_path_sizes) + sum(max_length_sizes)
+
+    header = serialise_metadata(
+        metadata,
+        build_default_metadata(
+            shape,
+            default_value,
+            possible_values,
+            max_path_sizes,
+            max_length_sizes,
+            (8 - entry_count * entry_bit_length % 8) % 8,
+        ),
+    )
+    if not possible_values:
+        file_handle.write(header.encode("utf-8"))
+        return
+
+    file_handle.write((header + chr(0) + "CD" + chr(0)).encode("utf-8"))
+
+    block_bits = STREAM_BLOCK_CHARS * 8
+    data_bits = ""
+    for entry in entries:
+        data_bits += entry_to_bits(
+            entry, value_lookup, value_bit_length, max_path_sizes, max_length_sizes
+        )
+        if len(data_bits) >= block_bits:
+            full_bits = len(data_bits) - len(data_bits) % 8
+            file_handle.write(bits_to_bytes(data_bits[:full_bits]).encode("utf-8"))
+            data_bits = data_bits[full_bits:]
+    file_handle.write(bits_to_bytes(data_bits).encode("utf-8"))
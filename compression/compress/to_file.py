@@ -1,8 +1,8 @@
 from typing import Dict
 
 from ..types import IntListND
-from .compress import compress
-from .serialise import serialise
+from .compress import compress, count_values, generate_entries, validate_and_copy
+from .serialise import serialise, serialise_to_file
 
 
 def compress_to_file(
@@ -17,3 +17,41 @@ def compress_to_file(
     """
     with open(file_path, "wb") as file_handle:
         file_handle.write(serialise(compress(data), metadata).encode("utf-8"))
+
+
+def stream_compress_to_file(
+    file_path: str, data: IntListND, metadata: Dict[str, str] = None
+) -> None:
+    """Compresses data to a file, writing entries as they are found instead of holding all of them in memory.
+    The cuboids are computed twice, once to count the entries per value and once to write them, so this takes
+    about twice the CPU time of compress_to_file.
+
+    Args:
+        file_path (str): File to write
+        data (IntListND): N dimensional list of integers to compress. Must have a consistent shape.
+        metadata (Dict[str, str], optional): Any custom metadata to save alongside the data. Defaults to None.
+    """
+    data_copy, shape = validate_and_copy(data)
+    # First pass only keeps a count per value, to find the default value, value table and number of entries
+    value_counts = count_values(generate_entries(data_copy, shape))
+    default_value = max(value_counts.items(), key=lambda item: item[1])[0]
+    possible_values = [value for value in value_counts if value != default_value]
+    entry_count = sum(value_counts.values()) - value_counts[default_value]
+
+    # Generating the entries consumes the copy, so a fresh one is needed for the second pass
+    data_copy, _ = validate_and_copy(data)
+    entries = (
+        entry
+        for entry in generate_entries(data_copy, shape)
+        if entry.value != default_value
+    )
+    with open(file_path, "wb") as file_handle:
+        serialise_to_file(
+            file_handle,
+            shape,
+            default_value,
+            possible_values,
+            entries,
+            entry_count,
+            metadata,
+        )
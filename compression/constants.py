@@ -1,5 +1,5 @@
 # Bumped whenever the serialisation format changes
-VERSION = 1
+VERSION = 2
 RESERVED_KEYS = {
     "SD",
     "VN",
@@ -18,3 +18,15 @@ RESERVED_KEYS = {
 KEYS_FOR_ENTRIES = {"MP", "MN", "VD", "DB", "DR", "RO", "AS", "DO", "CD"}
 # Must have 8 out of the 9 keys above, since MP is present with MN not, and vice versa
 MIN_ENTRIES_KEYS = 8
+# Multi-frame containers keep their frame index in a sidecar file next to the frame data
+FRAME_INDEX_SUFFIX = ".idx"
+# Width in bytes of every integer in the frame index, so frame k's offsets live at a fixed position
+FRAME_INDEX_INT_BYTES = 8
+# Frame index header holds the version number followed by the keyframe interval
+FRAME_INDEX_HEADER_INTS = 2
+DEFAULT_KEYFRAME_INTERVAL = 16
+KEYFRAME = "K"
+DELTA_FRAME = "D"
+# Number of characters of compressed data buffered before each write when streaming to a file.
+# Characters past 127 take 2 bytes once UTF-8 encoded, so each write is between 1 and 2 times this in bytes
+STREAM_BLOCK_CHARS = 4096
@@ -1,3 +1,4 @@
 from .decompress import decompress
 from .deserialise import deserialise
+from .frames_from_file import count_frames, decompress_frame_from_file
 from .from_file import decompress_from_file
@@ -78,7 +78,7 @@ def deserialise(serialised: str) -> Tuple[CompressedList, Dict[str, str] | None]
                     key = curr_item
                     curr_item = ""
             else:
-                metadata[key] = curr_item or chr(0)
+                metadata[key] = curr_item
                 key = None
                 curr_item = ""
     metadata[key] = curr_item
@@ -0,0 +1,108 @@
+import os
+from typing import BinaryIO, Dict, Tuple
+
+from ..constants import (
+    DELTA_FRAME,
+    FRAME_INDEX_HEADER_INTS,
+    FRAME_INDEX_INT_BYTES,
+    FRAME_INDEX_SUFFIX,
+    VERSION,
+)
+from ..exceptions import TruncatedFrameIndex, VersionMisMatch
+from ..types import IntListND
+from .decompress import decompress, set_data_entry
+from .deserialise import deserialise
+
+
+def read_index_int(index_handle: BinaryIO, position: int) -> int:
+    index_handle.seek(position * FRAME_INDEX_INT_BYTES)
+    int_bytes = index_handle.read(FRAME_INDEX_INT_BYTES)
+    if len(int_bytes) != FRAME_INDEX_INT_BYTES:
+        raise TruncatedFrameIndex(position, len(int_bytes))
+    return int.from_bytes(int_bytes, "big")
+
+
+def read_keyframe_interval(index_handle: BinaryIO) -> int:
+    version = read_index_int(index_handle, 0)
+    if version != VERSION:
+        raise VersionMisMatch(version)
+    return read_index_int(index_handle, 1)
+
+
+def count_frames_in_index(index_handle: BinaryIO) -> int:
+    index_handle.seek(0, os.SEEK_END)
+    return index_handle.tell() // FRAME_INDEX_INT_BYTES - FRAME_INDEX_HEADER_INTS
+
+
+def read_frame_start(index_handle: BinaryIO, frame_idx: int) -> int:
+    # The index stores the end offset of each frame, so a frame starts where the previous one ended
+    return (
+        read_index_int(index_handle, FRAME_INDEX_HEADER_INTS + frame_idx - 1)
+        if frame_idx > 0
+        else 0
+    )
+
+
+def read_frame_record(
+    file_handle: BinaryIO, index_handle: BinaryIO, frame_idx: int
+) -> Tuple[str, str]:
+    start = read_frame_start(index_handle, frame_idx)
+    end = read_index_int(index_handle, FRAME_INDEX_HEADER_INTS + frame_idx)
+    file_handle.seek(start)
+    record = file_handle.read(end - start).decode("utf-8")
+    return record[0], record[1:]
+
+
+def count_frames(file_path: str) -> int:
+    """Counts the frames in a multi-frame file
+
+    Args:
+        file_path (str): Multi-frame file to read
+
+    Returns:
+        int: Number of frames in the file, or 0 if it doesn't exist yet
+    """
+    if not os.path.exists(file_path + FRAME_INDEX_SUFFIX):
+        return 0
+    with open(file_path + FRAME_INDEX_SUFFIX, "rb") as index_handle:
+        read_keyframe_interval(index_handle)
+        return count_frames_in_index(index_handle)
+
+
+def decompress_frame_from_file(
+    file_path: str, frame_idx: int
+) -> Tuple[IntListND, Dict[str, str] | None]:
+    """Reads a single frame out of a multi-frame file, only touching the frame and its keyframe
+
+    Args:
+        file_path (str): Multi-frame file to read
+        frame_idx (int): Index of the frame to read. Negative indices count from the end.
+
+    Returns:
+        Tuple[IntListND, Dict[str, str] | None]: The decompressed frame followed by any custom metadata
+    """
+    with open(file_path, "rb") as file_handle, open(
+        file_path + FRAME_INDEX_SUFFIX, "rb"
+    ) as index_handle:
+        keyframe_interval = read_keyframe_interval(index_handle)
+        num_frames = count_frames_in_index(index_handle)
+        if frame_idx < 0:
+            frame_idx += num_frames
+        if not 0 <= frame_idx < num_frames:
+            raise IndexError("Frame index out of range")
+
+        frame_type, serialised = read_frame_record(
+            file_handle, index_handle, frame_idx
+        )
+        compressed_list, metadata = deserialise(serialised)
+        if frame_type != DELTA_FRAME:
+            return decompress(compressed_list), metadata
+
+        _, serialised_keyframe = read_frame_record(
+            file_handle, index_handle, frame_idx - frame_idx % keyframe_interval
+        )
+        data = decompress(deserialise(serialised_keyframe)[0])
+        # Delta entries first clear the keyframe entries that are gone, then paint the new ones
+        for entry in compressed_list.entries:
+            set_data_entry(data, entry.value, entry.path, entry.lengths)
+        return data, metadata
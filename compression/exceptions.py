@@ -1,5 +1,5 @@
 from typing import Tuple
-from .constants import VERSION
+from .constants import FRAME_INDEX_INT_BYTES, VERSION
 
 
 class InconsistentShape(Exception):
@@ -21,3 +21,10 @@ class VersionMisMatch(Exception):
         super().__init__(
             f"Tried deserialising data with an incompatible version. Current version: {VERSION}, version read: {version_read}"
         )
+
+
+class TruncatedFrameIndex(Exception):
+    def __init__(self, position: int, num_bytes: int) -> None:
+        super().__init__(
+            f"Frame index is truncated, expected {FRAME_INDEX_INT_BYTES} bytes at integer {position}, found {num_bytes}"
+        )